@@ -0,0 +1,118 @@
+"""
+Benchmark list payload size and compression cost.
+
+Builds a page of todos with long bodies and serializes it the way the
+list endpoint would: full bodies, and trimmed to a preview. Each body
+is then run through every available encoder, reporting bytes on the
+wire and CPU time per response. No database is needed:
+
+    python benchmarks/list_payload_size.py --todos 100 --body-words 400
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import timedelta
+
+from todo_list.api.compression import ENCODERS
+from todo_list.models.todo import utcnow
+from todo_list.schemas import (
+    TodoListFilter,
+    TodoListResponse,
+    TodoResponse,
+    TodoSummaryListResponse,
+    TodoSummaryResponse,
+)
+
+WORDS = (
+    "review deploy meeting invoice draft customer report budget schedule "
+    "follow up call email design test release migrate backup fix update "
+    "quarterly roadmap feedback notes sprint hiring onboarding travel"
+).split()
+
+
+def make_todos(count: int, body_words: int) -> list[dict]:
+    rng = random.Random(0)
+    now = utcnow()
+    todos = []
+    for i in range(count):
+        body = " ".join(rng.choice(WORDS) for _ in range(body_words))
+        todos.append({
+            "id": uuid.uuid4(),
+            "title": f"todo {i}",
+            "body": body,
+            "status": "in_progress",
+            "priority": "medium",
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now - timedelta(minutes=i),
+            "due_date": now + timedelta(days=i % 30),
+            "tags": ["work", "q3"],
+        })
+    return todos
+
+
+def full_page(todos: list[dict], filters: TodoListFilter) -> bytes:
+    response = TodoListResponse(
+        todos=[TodoResponse(**todo) for todo in todos],
+        total=len(todos), page=1, page_size=filters.limit,
+    )
+    return response.model_dump_json().encode()
+
+
+def preview_page(todos: list[dict], filters: TodoListFilter) -> bytes:
+    # Mirrors left(body, n) and length(body) computed by the list query
+    summaries = []
+    for todo in todos:
+        fields = {key: value for key, value in todo.items() if key != "body"}
+        fields["body_preview"] = todo["body"][:filters.body_preview] or None
+        fields["body_length"] = len(todo["body"])
+        summaries.append(TodoSummaryResponse(**fields))
+
+    response = TodoSummaryListResponse(
+        todos=summaries, total=len(todos), page=1, page_size=filters.limit,
+    )
+    return response.model_dump_json().encode()
+
+
+def measure(data: bytes, encoding: str, iterations: int) -> tuple[int, float]:
+    """Compressed size and median CPU milliseconds to compress `data`."""
+    timings = []
+    for _ in range(iterations):
+        compressor = ENCODERS[encoding]()
+        start = time.process_time()
+        compressed = compressor.compress(data) + compressor.finish()
+        timings.append((time.process_time() - start) * 1000)
+    return len(compressed), statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--todos", type=int, default=100)
+    parser.add_argument("--body-words", type=int, default=400)
+    parser.add_argument("--preview", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    todos = make_todos(args.todos, args.body_words)
+    pages = {
+        "full": full_page(todos, TodoListFilter(limit=args.todos)),
+        f"preview={args.preview}": preview_page(
+            todos, TodoListFilter(limit=args.todos, body_preview=args.preview)
+        ),
+    }
+
+    print(f"{'payload':<14} {'encoding':<9} {'bytes':>9} {'ratio':>7} {'cpu ms':>8}")
+    for name, data in pages.items():
+        print(f"{name:<14} {'identity':<9} {len(data):>9} {1:>7.2f} {0:>8.3f}")
+        for encoding in ENCODERS:
+            size, cpu_ms = measure(data, encoding, args.iterations)
+            print(f"{name:<14} {encoding:<9} {size:>9} {len(data) / size:>7.2f} {cpu_ms:>8.3f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
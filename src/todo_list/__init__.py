@@ -5,8 +5,10 @@ from flask_cors import CORS
 from werkzeug.exceptions import HTTPException
 
 from todo_list.config import settings
-from todo_list.extensions import db, migrate
+from todo_list.extensions import db, migrate, overdue_scheduler
+from todo_list.api.compression import init_compression
 from todo_list.api.dependencies import init_dependencies
+from todo_list.repositories.history import register_history_listener
 
 
 """Flask application factory"""
@@ -41,6 +43,10 @@ def create_app():
     
     db.init_app(app)
     migrate.init_app(app, db)
+    overdue_scheduler.init_app(app, db)
+    
+    # Todo change history, written in the same flush as the todo
+    register_history_listener(db.session)
     
     # CORS
     CORS(app, origins=settings.cors_origins)
@@ -48,6 +54,9 @@ def create_app():
     # Dependencies
     init_dependencies(app)
     
+    # Response compression
+    init_compression(app)
+    
     # ─────────────────────────────────────────────────────────────────
     # Register Blueprints
     # ─────────────────────────────────────────────────────────────────
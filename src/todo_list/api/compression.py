@@ -0,0 +1,180 @@
+"""Response compression negotiated from the Accept-Encoding header."""
+
+import zlib
+from typing import Callable, Iterable, Iterator, Protocol
+
+from flask import Flask, Response, request
+from todo_list.config import settings
+
+# Optional encoders from the `compression` extra
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# ─────────────────────────────────────────────────────────────────
+# Encoders
+# ─────────────────────────────────────────────────────────────────
+
+class Compressor(Protocol):
+    """
+    Streaming compressor. `flush` emits everything buffered so far and
+    keeps the stream open; `finish` ends the stream.
+    """
+
+    def compress(self, data: bytes) -> bytes: ...
+    def flush(self) -> bytes: ...
+    def finish(self) -> bytes: ...
+
+
+class _GzipCompressor:
+    def __init__(self):
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self):
+        # Quality 4 gives up some ratio for far less CPU than higher levels
+        self._compressor = brotli.Compressor(quality=4)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdCompressor:
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=3).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def _available_encoders() -> dict[str, Callable[[], Compressor]]:
+    """Encoders by Accept-Encoding token, in server preference order."""
+    encoders: dict[str, Callable[[], Compressor]] = {}
+    if zstandard is not None:
+        encoders["zstd"] = _ZstdCompressor
+    if brotli is not None:
+        encoders["br"] = _BrotliCompressor
+    encoders["gzip"] = _GzipCompressor
+    return encoders
+
+
+ENCODERS = _available_encoders()
+
+
+# ─────────────────────────────────────────────────────────────────
+# Response Handling
+# ─────────────────────────────────────────────────────────────────
+
+def _should_compress(response: Response) -> bool:
+    if response.status_code < 200 or response.status_code in (204, 206, 304):
+        return False
+    if "Content-Encoding" in response.headers:
+        return False
+    # Files may be served with ranges, which would break once compressed
+    if response.direct_passthrough:
+        return False
+    return response.mimetype in settings.compression_mimetypes
+
+
+def _stream(chunks: Iterable[bytes], compressor: Compressor) -> Iterator[bytes]:
+    """
+    Compress a streamed body chunk by chunk.
+
+    Each chunk is flushed so the client can decode it as soon as it
+    arrives, instead of receiving the whole body at the end.
+    """
+    for chunk in chunks:
+        compressed = compressor.compress(chunk) + compressor.flush()
+        if compressed:
+            yield compressed
+    yield compressor.finish()
+
+
+def compress_response(response: Response) -> Response:
+    """
+    Compress a response body with the best encoding the client accepts.
+
+    Buffered bodies smaller than `compression_min_size` are sent as-is,
+    since the encoding overhead outweighs the savings. Streamed bodies
+    have no known size and are always compressed, chunk by chunk.
+    """
+    if not _should_compress(response):
+        return response
+
+    response.vary.add("Accept-Encoding")
+
+    encoding = request.accept_encodings.best_match(list(ENCODERS))
+    if encoding is None:
+        return response
+
+    compressor = ENCODERS[encoding]()
+
+    if response.is_streamed:
+        response.response = _stream(response.iter_encoded(), compressor)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < settings.compression_min_size:
+            return response
+        response.set_data(compressor.compress(data) + compressor.finish())
+
+    response.headers["Content-Encoding"] = encoding
+    # A strong ETag must change with the representation
+    etag, weak = response.get_etag()
+    if etag is not None and not weak:
+        response.set_etag(etag, weak=True)
+
+    return response
+
+
+# ─────────────────────────────────────────────────────────────────
+# Initialization
+# ─────────────────────────────────────────────────────────────────
+
+def init_compression(app: Flask) -> None:
+    """
+    Register response compression with the Flask app.
+
+    gzip is always available; brotli and zstd are offered when the
+    `compression` extra is installed (`poetry install -E compression`).
+
+    Usage:
+        from todo_list.api.compression import init_compression
+
+        def create_app():
+            app = Flask(__name__)
+            # ... configure app ...
+            init_compression(app)
+            return app
+    """
+    if settings.compression_enabled:
+        app.after_request(compress_response)
@@ -1,8 +1,10 @@
 """Database dependency management for Flask-SQLAlchemy."""
 
 from typing import Type, TypeVar
+from uuid import UUID
 from sqlalchemy.orm import Session
-from flask import Flask, g
+from flask import Flask, abort, g, request
+from todo_list.config import settings
 from todo_list.extensions import db
 
 T = TypeVar('T')
@@ -35,6 +37,36 @@ def get_db() -> Session:
     return db.session
 
 
+# ─────────────────────────────────────────────────────────────────
+# Owner (Tenant) Access
+# ─────────────────────────────────────────────────────────────────
+
+def get_owner_id() -> UUID:
+    """
+    Get the owner (tenant) id of the current request.
+    
+    Read once from the configured owner header and cached on `g`.
+    Requests without a valid owner id are rejected with 400, so
+    repositories are never built without a tenant scope.
+    
+    Usage:
+        @app.route('/todos')
+        def list_todos():
+            owner_id = get_owner_id()
+            ...
+    """
+    if 'owner_id' not in g:
+        raw = request.headers.get(settings.owner_header)
+        if raw is None:
+            abort(400, description=f"Missing {settings.owner_header} header")
+        try:
+            g.owner_id = UUID(raw)
+        except ValueError:
+            abort(400, description=f"Invalid {settings.owner_header} header")
+    
+    return g.owner_id
+
+
 # ─────────────────────────────────────────────────────────────────
 # Repository Injection (Recommended)
 # ─────────────────────────────────────────────────────────────────
@@ -51,21 +83,47 @@ def get_repository(repo_class: Type[T]) -> T:
     - Encapsulates database logic in testable repositories
     - Leverages your existing repository layer
     
+    For repositories scoped to a tenant, use `get_owned_repository`.
+    
+    Usage:
+        from todo_list.repositories.overdue import OverdueRepository
+        
+        @app.route('/admin/upcoming')
+        def upcoming():
+            repo = get_repository(OverdueRepository)
+            return {"upcoming": repo.get_upcoming(utcnow(), 10)}
+    """
+    cache_key = f'repo_{repo_class.__name__}'
+    
+    if cache_key not in g:
+        setattr(g, cache_key, repo_class(db.session))
+    
+    return getattr(g, cache_key)
+
+
+def get_owned_repository(repo_class: Type[T]) -> T:
+    """
+    Get owner-scoped repository instance with Flask-SQLAlchemy session.
+    
+    Like `get_repository`, but the repository is also given the owner
+    id of the current request, so the request is rejected with 400
+    when it carries no owner.
+    
     Usage:
         from todo_list.repositories.todo import TodoRepository
         
         @app.route('/todos')
         def list_todos():
-            repo = get_repository(TodoRepository)
+            repo = get_owned_repository(TodoRepository)
             todos, total = repo.list(filters)
             return {"todos": [t.to_dict() for t in todos], "total": total}
     """
-    cache_key = f'repo_{repo_class.__name__}'
+    cache_key = f'repo_owned_{repo_class.__name__}'
     
     if cache_key not in g:
-        g[cache_key] = repo_class(db.session)
+        setattr(g, cache_key, repo_class(db.session, get_owner_id()))
     
-    return g[cache_key]
+    return getattr(g, cache_key)
 
 
 # ─────────────────────────────────────────────────────────────────
@@ -98,6 +156,6 @@ def init_dependencies(app: Flask) -> None:
         but we clear our repository cache for good measure.
         """
         # Clear all cached repositories from Flask's g object
-        repo_keys = [key for key in g.keys() if key.startswith('repo_')]
+        repo_keys = [key for key in g if key.startswith('repo_')]
         for key in repo_keys:
             g.pop(key, None)
\ No newline at end of file
@@ -68,7 +68,67 @@ class Settings(BaseSettings):
         default=100,
         description="Maximum allowed page size"
     )
+    owner_header: str = Field(
+        default="X-Owner-Id",
+        description="Request header carrying the owner (tenant) id of the caller"
+    )
     
+    # ─────────────────────────────────────────────────────────────────
+    # Response Compression
+    # ─────────────────────────────────────────────────────────────────
+
+    compression_enabled: bool = Field(
+        default=True,
+        description="Compress responses for clients that accept it"
+    )
+    compression_min_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Smallest response body in bytes worth compressing"
+    )
+    compression_mimetypes: list[str] = Field(
+        default=["application/json", "text/html", "text/plain", "text/css", "text/javascript"],
+        description="Response mimetypes eligible for compression"
+    )
+
+    # ─────────────────────────────────────────────────────────────────
+    # Overdue Scheduler
+    # ─────────────────────────────────────────────────────────────────
+
+    overdue_scheduler_enabled: bool = Field(
+        default=False,
+        description="Run the overdue scheduler in a background thread of the web process"
+    )
+    overdue_advisory_lock_key: int = Field(
+        default=726_001,
+        description="Postgres advisory lock key held by the active overdue worker"
+    )
+    overdue_notify_channel: str = Field(
+        default="todo_due_dates",
+        pattern=r"^[a-z_][a-z0-9_]*$",
+        description="Postgres NOTIFY channel that carries due date changes to the active overdue worker"
+    )
+    overdue_refresh_interval: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds between fallback polls for due dates changed without a notification"
+    )
+    overdue_batch_window: float = Field(
+        default=1.0,
+        ge=0,
+        description="Seconds to wait after a due boundary so close deadlines share one batch"
+    )
+    overdue_commit_grace: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds each overdue scan looks back for rows whose transaction committed late"
+    )
+    overdue_preload_limit: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum number of upcoming due dates held in the scheduler heap"
+    )
+
     # ─────────────────────────────────────────────────────────────────
     # CORS Settings
     # ─────────────────────────────────────────────────────────────────
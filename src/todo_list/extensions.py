@@ -4,6 +4,9 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 
+from todo_list.jobs import OverdueScheduler
+
 # Initialize extensions without app context
 db = SQLAlchemy()
-migrate = Migrate()
\ No newline at end of file
+migrate = Migrate()
+overdue_scheduler = OverdueScheduler()
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .overdue import OverdueScheduler, OverdueListener
+
+__all__ = ["OverdueScheduler", "OverdueListener"]
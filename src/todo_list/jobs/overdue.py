@@ -0,0 +1,399 @@
+"""Background scheduler that emits events when todos become overdue."""
+
+import heapq
+import logging
+import socket
+import threading
+from datetime import datetime, timedelta
+from select import select as wait_readable
+from typing import Callable
+from uuid import UUID
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import Connection, func, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import object_session
+
+from todo_list.config import settings
+from todo_list.models import Todo, TodoStatus
+from todo_list.models.todo import utcnow
+from todo_list.repositories.overdue import OverdueRepository
+from todo_list.schemas import TodoOverdueEvent
+
+logger = logging.getLogger(__name__)
+
+OverdueListener = Callable[[list[TodoOverdueEvent]], None]
+
+
+class OverdueScheduler:
+    """
+    Wakes up only when the next due date passes and emits the todos
+    that became overdue since the previous wake-up as one batch.
+
+    Upcoming due dates are kept in a min-heap. The heap is only a
+    timer: on every wake-up the todos in (watermark - grace, now] are
+    read back from the database, so stale or duplicate heap entries
+    cost one cheap indexed query and never produce wrong events.
+
+    `watermark` and `updated_at` are wall-clock times stamped before
+    commit, so every scan and poll looks back `overdue_commit_grace`
+    seconds to catch transactions that committed late. Todos already
+    emitted inside that trailing window are remembered by id and due
+    date and not emitted twice. Rows committed more than the grace
+    period after their due date are not reported as events.
+
+    The heap is kept current incrementally, from any process:
+    - `notify()` is called by TodoService when a due date is set and
+      sends a Postgres NOTIFY on `overdue_notify_channel`, delivered
+      when the writing transaction commits
+    - the leader LISTENs on its lock connection and pushes each change
+      onto the heap, waking up early only if the change moves the next
+      due date, not to scan
+    - rows changed without a notification (bulk updates, notifications
+      sent while no leader was listening) are polled every
+      `overdue_refresh_interval` seconds through `updated_at`
+
+    Any number of processes may run the scheduler. Only the one
+    holding the Postgres advisory lock `overdue_advisory_lock_key`
+    does the work; the others retry the lock periodically and take
+    over if the leader's connection goes away. The leader re-checks
+    that its connection still holds the lock before every scan and
+    steps down as soon as it does not. Deadlines that pass
+    while no process holds the lock are not replayed as events, but
+    are still returned by `TodoRepository.get_overdue`.
+
+    Usage:
+        from todo_list.extensions import overdue_scheduler
+
+        @overdue_scheduler.subscribe
+        def send_reminders(events):
+            for event in events:
+                ...
+    """
+
+    def __init__(self, app: Flask | None = None, db: SQLAlchemy | None = None):
+        self.app: Flask | None = None
+        self.db: SQLAlchemy | None = None
+
+        self._listeners: list[OverdueListener] = []
+        self._heap: list[tuple[datetime, UUID]] = []
+        self._horizon: datetime | None = None
+        self._watermark: datetime | None = None
+        self._last_refresh: datetime | None = None
+        self._emitted: dict[UUID, datetime] = {}
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._waker: tuple[socket.socket, socket.socket] | None = None
+        self._thread: threading.Thread | None = None
+
+        if app is not None and db is not None:
+            self.init_app(app, db)
+
+    # ─────────────────────────────────────────────────────────────────
+    # Initialization
+    # ─────────────────────────────────────────────────────────────────
+
+    def init_app(self, app: Flask, db: SQLAlchemy) -> None:
+        """Bind the scheduler to an app and register the worker command."""
+        self.app = app
+        self.db = db
+        app.extensions["overdue_scheduler"] = self
+
+        @app.cli.command("overdue-worker")
+        def overdue_worker():
+            """Run the overdue scheduler in the foreground."""
+            self.run_forever()
+
+        if settings.overdue_scheduler_enabled:
+            self.start()
+
+    def subscribe(self, listener: OverdueListener) -> OverdueListener:
+        """Register a callable that receives each batch of overdue events."""
+        self._listeners.append(listener)
+        return listener
+
+    # ─────────────────────────────────────────────────────────────────
+    # Incremental Updates
+    # ─────────────────────────────────────────────────────────────────
+
+    def notify(self, todo: Todo) -> None:
+        """
+        Announce a todo's due date to the leader, in whichever process it runs.
+
+        The notification is sent in the todo's transaction, so it is
+        delivered on commit and dropped on rollback.
+        """
+        if todo.due_date is None or todo.status == TodoStatus.completed:
+            return
+
+        session = object_session(todo) or self.db.session
+        payload = f"{todo.id} {todo.due_date.isoformat()}"
+        session.execute(select(func.pg_notify(settings.overdue_notify_channel, payload)))
+
+    def _receive(self, driver_connection) -> None:
+        """Push the due dates of all notifications queued on the lock connection."""
+        for notification in driver_connection.notifies(timeout=0):
+            try:
+                todo_id, due_date = notification.payload.split(" ")
+                change = (datetime.fromisoformat(due_date), UUID(todo_id))
+            except ValueError:
+                logger.warning(f"Ignoring malformed due date notification {notification.payload!r}")
+                continue
+
+            with self._lock:
+                self._push(*change)
+
+    def _push(self, due_date: datetime, todo_id: UUID) -> bool:
+        """Push a due date onto the heap; return True if it is the new minimum."""
+        if self._watermark is not None and due_date <= self._watermark:
+            return False
+        # Anything past the horizon is picked up by the next reload
+        if self._horizon is not None and due_date > self._horizon:
+            return False
+
+        heapq.heappush(self._heap, (due_date, todo_id))
+        return self._heap[0][1] == todo_id
+
+    # ─────────────────────────────────────────────────────────────────
+    # Scheduling
+    # ─────────────────────────────────────────────────────────────────
+
+    def run_pending(self, now: datetime | None = None) -> list[TodoOverdueEvent]:
+        """Emit every todo whose due date passed since the last run."""
+        now = now or utcnow()
+        repository = OverdueRepository(self.db.session)
+
+        grace = timedelta(seconds=settings.overdue_commit_grace)
+
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                heapq.heappop(self._heap)
+            watermark = self._watermark or now
+            self._watermark = now
+            reload = not self._heap and self._horizon is not None
+
+        todos = repository.get_became_overdue(watermark - grace, now)
+        events = []
+        for todo in todos:
+            if self._emitted.get(todo.id) == todo.due_date:
+                continue
+            self._emitted[todo.id] = todo.due_date
+            events.append(
+                TodoOverdueEvent(
+                    todo_id=todo.id,
+                    owner_id=todo.owner_id,
+                    title=todo.title,
+                    due_date=todo.due_date,
+                    detected_at=now,
+                )
+            )
+
+        # The next scan starts at now - grace; older entries can't recur
+        self._emitted = {
+            todo_id: due_date
+            for todo_id, due_date in self._emitted.items()
+            if due_date > now - grace
+        }
+
+        if reload:
+            self._load(now)
+
+        if events:
+            self._emit(events)
+        return events
+
+    def _load(self, now: datetime) -> None:
+        """Fill the heap with the earliest upcoming due dates."""
+        limit = settings.overdue_preload_limit
+        upcoming = OverdueRepository(self.db.session).get_upcoming(now, limit)
+
+        with self._lock:
+            self._heap = upcoming
+            heapq.heapify(self._heap)
+            self._horizon = upcoming[-1][0] if len(upcoming) == limit else None
+
+    def _refresh(self, now: datetime) -> None:
+        """Pick up due dates changed by other processes since the last poll."""
+        since = (self._last_refresh or now) - timedelta(seconds=settings.overdue_commit_grace)
+        changed = OverdueRepository(self.db.session).get_changed_since(since, now)
+        self._last_refresh = now
+
+        with self._lock:
+            for due_date, todo_id in changed:
+                self._push(due_date, todo_id)
+
+    def _next_timeout(self, now: datetime) -> float:
+        """Seconds to sleep until the next due date or refresh poll."""
+        refresh_at = self._last_refresh + timedelta(seconds=settings.overdue_refresh_interval)
+        wake_at = refresh_at
+
+        with self._lock:
+            if self._heap:
+                due_at = self._heap[0][0] + timedelta(seconds=settings.overdue_batch_window)
+                wake_at = min(wake_at, due_at)
+
+        return max((wake_at - now).total_seconds(), 0.0)
+
+    def _emit(self, events: list[TodoOverdueEvent]) -> None:
+        logger.info(f"{len(events)} todo(s) became overdue")
+
+        for listener in self._listeners:
+            try:
+                listener(events)
+            except Exception:
+                logger.exception(f"Overdue listener {listener!r} failed")
+
+    # ─────────────────────────────────────────────────────────────────
+    # Worker Lifecycle
+    # ─────────────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Run the scheduler in a daemon thread of the current process."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run_forever, name="overdue-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Ask the worker loop to exit and wait for it."""
+        self._stop.set()
+        waker = self._waker
+        if waker is not None:
+            try:
+                waker[1].send(b"\0")
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_forever(self) -> None:
+        """Compete for the advisory lock and run the schedule while holding it."""
+        key = settings.overdue_advisory_lock_key
+
+        while not self._stop.is_set():
+            try:
+                with self.app.app_context(), self.db.engine.connect() as conn:
+                    if self._try_lock(conn, key):
+                        logger.info("Acquired overdue scheduler lock")
+                        try:
+                            self._lead(conn, key)
+                        finally:
+                            self._unlock(conn, key)
+            except Exception:
+                logger.exception("Overdue scheduler failed, retrying")
+
+            self._stop.wait(settings.overdue_refresh_interval)
+
+    def _lead(self, conn: Connection, key: int) -> None:
+        channel = settings.overdue_notify_channel
+        # Listen before loading, so no change falls between the two
+        self._listen(conn, channel)
+        self._waker = socket.socketpair()
+
+        now = utcnow()
+        with self._lock:
+            self._watermark = now
+        self._last_refresh = now
+
+        try:
+            self._load(now)
+            self.db.session.remove()
+            self._loop(conn, key)
+        finally:
+            for sock in self._waker:
+                sock.close()
+            self._waker = None
+            with self._lock:
+                self._heap = []
+                self._horizon = None
+                self._watermark = None
+                self._emitted = {}
+            self._unlisten(conn, channel)
+
+    def _loop(self, conn: Connection, key: int) -> None:
+        while not self._stop.is_set():
+            # Another worker may have taken over if our connection dropped
+            if not self._holds_lock(conn, key):
+                logger.warning("Lost overdue scheduler lock, stepping down")
+                return
+
+            now = utcnow()
+            try:
+                refresh_at = self._last_refresh + timedelta(seconds=settings.overdue_refresh_interval)
+                if now >= refresh_at:
+                    self._refresh(now)
+                self.run_pending(now)
+            finally:
+                # Don't hold a transaction open while sleeping
+                self.db.session.remove()
+
+            self._wait(conn)
+
+    def _wait(self, conn: Connection) -> None:
+        """
+        Sleep until the next due date or refresh poll.
+
+        Due date notifications arriving meanwhile are pushed onto the
+        heap and the sleep is shortened if they move the next due date.
+        """
+        driver_connection = conn.connection.driver_connection
+        waker = self._waker[0]
+
+        while not self._stop.is_set():
+            self._receive(driver_connection)
+            timeout = self._next_timeout(utcnow())
+            if timeout <= 0:
+                return
+
+            ready, _, _ = wait_readable([driver_connection, waker], [], [], timeout)
+            if not ready:
+                return
+            if waker in ready:
+                waker.recv(64)
+
+    @staticmethod
+    def _try_lock(conn: Connection, key: int) -> bool:
+        acquired = conn.execute(select(func.pg_try_advisory_lock(key))).scalar()
+        conn.commit()
+        return bool(acquired)
+
+    @staticmethod
+    def _holds_lock(conn: Connection, key: int) -> bool:
+        # pg_locks splits a bigint advisory key into classid (high) and objid (low)
+        stmt = text(
+            "SELECT EXISTS ("
+            " SELECT 1 FROM pg_locks"
+            " WHERE locktype = 'advisory' AND granted AND objsubid = 1"
+            " AND pid = pg_backend_pid()"
+            " AND ((classid::bigint << 32) | objid::bigint) = :key"
+            ")"
+        )
+        try:
+            held = conn.execute(stmt, {"key": key}).scalar()
+            conn.commit()
+        except DBAPIError:
+            return False
+        return bool(held)
+
+    @staticmethod
+    def _unlock(conn: Connection, key: int) -> None:
+        conn.execute(select(func.pg_advisory_unlock(key)))
+        conn.commit()
+
+    @staticmethod
+    def _listen(conn: Connection, channel: str) -> None:
+        # Channel names are identifiers; the setting only allows plain ones
+        conn.execute(text(f"LISTEN {channel}"))
+        conn.commit()
+
+    @staticmethod
+    def _unlisten(conn: Connection, channel: str) -> None:
+        conn.execute(text(f"UNLISTEN {channel}"))
+        conn.commit()
@@ -1,4 +1,15 @@
 from .base import Base
+from .tag import Tag, todo_tags
 from .todo import Todo, TodoStatus, TodoPriority
+from .todo_change import TodoChange, TodoChangeKind
 
-__all__ = ["Base", "Todo", "TodoStatus", "TodoPriority"]
\ No newline at end of file
+__all__ = [
+    "Base",
+    "Tag",
+    "Todo",
+    "TodoChange",
+    "TodoChangeKind",
+    "TodoStatus",
+    "TodoPriority",
+    "todo_tags",
+]
\ No newline at end of file
@@ -0,0 +1,42 @@
+import uuid
+
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Index,
+    String,
+    Table,
+    UniqueConstraint,
+)
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+# Association between todos and tags. The primary key serves loading
+# a todo's tags; the reverse index serves filtering todos by tag.
+todo_tags = Table(
+    "todo_tags",
+    Base.metadata,
+    Column("todo_id", ForeignKey("todos.id", ondelete="CASCADE"), primary_key=True),
+    Column("tag_id", ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
+    Index("ix_todo_tags_tag_todo", "tag_id", "todo_id"),
+)
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid4,
+        nullable=False,
+    )
+
+    owner_id: Mapped[uuid.UUID] = mapped_column(nullable=False)
+
+    name: Mapped[str] = mapped_column(String(32), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("owner_id", "name", name="uq_tags_owner_name"),
+    )
@@ -8,12 +8,14 @@ from sqlalchemy import (
     Text,
     Index,
     Enum as sqlEnum,
+    text,
 )
 
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from .base import Base
+from .tag import Tag, todo_tags
 
 
 def utcnow() -> datetime:
@@ -40,30 +42,50 @@ class Todo(Base):
         nullable=False,
     )
     
+    owner_id: Mapped[uuid.UUID] = mapped_column(nullable=False)
+    
     title: Mapped[str] = mapped_column(String(64), index=True)
     
     body: Mapped[str] = mapped_column(Text, nullable=True)
     
     status: Mapped[TodoStatus] = mapped_column(
         sqlEnum(TodoStatus, name="todo_status"), 
-        index=True, default=TodoStatus.not_started)
+        default=TodoStatus.not_started)
     
     priority: Mapped[TodoPriority] = mapped_column(
         sqlEnum(TodoPriority, name="todo_priority"), 
-        index=True, default=TodoPriority.low)
+        default=TodoPriority.low)
     
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utcnow, index=True)
+        DateTime(timezone=True), default=utcnow)
     
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+        DateTime(timezone=True), default=utcnow, onupdate=utcnow, index=True)
     
     due_date: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
     
+    tags: Mapped[list[Tag]] = relationship(
+        secondary=todo_tags, order_by=Tag.name)
+    
+    # Only populated by list queries that ask for a body preview
+    body_preview: Mapped[str | None] = query_expression()
+    
+    body_length: Mapped[int | None] = query_expression()
+    
+    # Every tenant query filters on owner_id, so list indexes lead with it
     __table_args__ = (
-        Index("ix_todos_status_created", "status", "created_at")
+        Index("ix_todos_owner_status_created", "owner_id", "status", "created_at"),
+        Index("ix_todos_owner_priority_created", "owner_id", "priority", "created_at"),
+        Index("ix_todos_owner_created", "owner_id", "created_at"),
+        Index("ix_todos_owner_updated", "owner_id", "updated_at"),
+        Index("ix_todos_owner_due_date", "owner_id", "due_date"),
+        Index(
+            "ix_todos_due_date_open",
+            "due_date",
+            postgresql_where=text("status <> 'completed' AND due_date IS NOT NULL"),
+        ),
     )
     
     
@@ -0,0 +1,71 @@
+import uuid
+import enum as py_enum
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Identity,
+    Index,
+    Enum as sqlEnum,
+    text,
+)
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+from .todo import utcnow
+
+
+# Predicate of the partial index used by "status at time T" lookups
+HAS_STATUS = "changes ? 'status'"
+
+class TodoChangeKind(str, py_enum.Enum):
+    created = "created"
+    updated = "updated"
+    deleted = "deleted"
+
+class TodoChange(Base):
+    """
+    Append-only log of todo changes.
+
+    `changes` holds only the fields that changed, mapped to their new
+    values. A deleted todo records {"status": null} so that status
+    lookups see it stop existing.
+    """
+    __tablename__ = "todo_changes"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(), primary_key=True)
+
+    # No foreign key: history outlives the todo it describes
+    todo_id: Mapped[uuid.UUID] = mapped_column(nullable=False)
+
+    owner_id: Mapped[uuid.UUID] = mapped_column(nullable=False)
+
+    kind: Mapped[TodoChangeKind] = mapped_column(
+        sqlEnum(TodoChangeKind, name="todo_change_kind"), nullable=False)
+
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utcnow, nullable=False)
+
+    changes: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    __table_args__ = (
+        Index("ix_todo_changes_todo_id", "todo_id", "id"),
+        Index(
+            "ix_todo_changes_todo_status",
+            "todo_id",
+            "changed_at",
+            "id",
+            postgresql_where=text(HAS_STATUS),
+        ),
+        # Rows arrive in time order, so a BRIN index stays tiny
+        Index(
+            "ix_todo_changes_changed_at_brin",
+            "changed_at",
+            postgresql_using="brin",
+        ),
+    )
@@ -0,0 +1,164 @@
+"""Todo history repository and the flush hook that records changes."""
+
+import uuid
+import enum as py_enum
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, event, inspect, select, text
+from sqlalchemy.orm import Session, scoped_session
+
+from todo_list.models import Todo, TodoChange, TodoChangeKind, TodoPriority, TodoStatus
+from todo_list.models.todo import utcnow
+from todo_list.models.todo_change import HAS_STATUS
+
+# Fields recorded in the change log; updated_at is implied by changed_at
+TRACKED_FIELDS = ("title", "body", "status", "priority", "due_date", "tags")
+
+
+# ─────────────────────────────────────────────────────────────────
+# Change Capture
+# ─────────────────────────────────────────────────────────────────
+
+def _to_json(field: str, value: Any) -> Any:
+    """JSON-ready form of a tracked field's value."""
+    if field == "tags":
+        return [tag.name for tag in value]
+    if isinstance(value, py_enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _diff(todo: Todo) -> dict[str, Any]:
+    """New values of the tracked fields changed on a todo since load."""
+    state = inspect(todo)
+    changes = {}
+    for field in TRACKED_FIELDS:
+        history = state.attrs[field].history
+        if not history.has_changes():
+            continue
+        changes[field] = _to_json(field, getattr(todo, field))
+    return changes
+
+
+def _snapshot(todo: Todo) -> dict[str, Any]:
+    """Values of all tracked fields on a new todo."""
+    changes = {
+        field: _to_json(field, getattr(todo, field))
+        for field in TRACKED_FIELDS
+    }
+    # Column defaults are also applied later, during the flush
+    changes["status"] = _to_json("status", todo.status or TodoStatus.not_started)
+    changes["priority"] = _to_json("priority", todo.priority or TodoPriority.low)
+    return changes
+
+
+def _record(todo: Todo, kind: TodoChangeKind, changes: dict[str, Any], now: datetime) -> TodoChange:
+    return TodoChange(
+        todo_id=todo.id,
+        owner_id=todo.owner_id,
+        kind=kind,
+        changed_at=now,
+        changes=changes,
+    )
+
+
+def capture_todo_changes(session: Session, flush_context, instances) -> None:
+    """
+    Add a TodoChange for every todo created, updated or deleted in this flush.
+
+    Runs before the flush, so the log rows are inserted in the same
+    statement batch and transaction as the todo writes themselves.
+    """
+    now = utcnow()
+    records = []
+
+    for obj in session.new:
+        if isinstance(obj, Todo):
+            # The id default only fires during the flush; the log needs it now
+            if obj.id is None:
+                obj.id = uuid.uuid4()
+            records.append(_record(obj, TodoChangeKind.created, _snapshot(obj), now))
+
+    for obj in session.dirty:
+        if isinstance(obj, Todo) and session.is_modified(obj):
+            changes = _diff(obj)
+            if changes:
+                records.append(_record(obj, TodoChangeKind.updated, changes, now))
+
+    for obj in session.deleted:
+        if isinstance(obj, Todo):
+            records.append(_record(obj, TodoChangeKind.deleted, {"status": None}, now))
+
+    session.add_all(records)
+
+
+def register_history_listener(session: Session | scoped_session) -> None:
+    """Record todo changes on every flush of the given session (or session class)."""
+    if not event.contains(session, "before_flush", capture_todo_changes):
+        event.listen(session, "before_flush", capture_todo_changes)
+
+
+# ─────────────────────────────────────────────────────────────────
+# Queries
+# ─────────────────────────────────────────────────────────────────
+
+class TodoHistoryRepository:
+    """Repository for reading the todo change log of a single owner."""
+
+    def __init__(self, session: Session, owner_id: UUID):
+        self.session = session
+        self.owner_id = owner_id
+
+    def list(
+        self, todo_id: UUID, limit: int, before: int | None = None
+    ) -> tuple[list[TodoChange], int | None]:
+        """
+        Page of changes to a todo, newest first, keyset-paged by change id.
+
+        Returns the page and the `before` cursor of the next page, or
+        None if this is the last one.
+        """
+        stmt = select(TodoChange).where(
+            TodoChange.owner_id == self.owner_id,
+            TodoChange.todo_id == todo_id
+        )
+        if before is not None:
+            stmt = stmt.where(TodoChange.id < before)
+
+        # Fetch one extra row to learn whether another page exists
+        stmt = stmt.order_by(TodoChange.id.desc()).limit(limit + 1)
+        changes = list(self.session.execute(stmt).scalars().all())
+
+        if len(changes) <= limit:
+            return changes, None
+        changes = changes[:limit]
+        return changes, changes[-1].id
+
+    def status_at(self, todo_id: UUID, at: datetime) -> TodoStatus | None:
+        """
+        Status of a todo at a point in time.
+
+        Reads the single latest status-changing row at or before `at`
+        from a partial index, however long the todo's history is.
+        Returns None if the todo did not exist at that time.
+        """
+        status = self.session.execute(self._status_at_select(todo_id, at)).scalar()
+        return TodoStatus(status) if status is not None else None
+
+    def _status_at_select(self, todo_id: UUID, at: datetime) -> Select:
+        # Matches the partial index ix_todo_changes_todo_status
+        return (
+            select(TodoChange.changes["status"].astext)
+            .where(
+                TodoChange.owner_id == self.owner_id,
+                TodoChange.todo_id == todo_id,
+                TodoChange.changed_at <= at,
+                text(HAS_STATUS)
+            )
+            .order_by(TodoChange.changed_at.desc(), TodoChange.id.desc())
+            .limit(1)
+        )
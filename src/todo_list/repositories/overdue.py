@@ -0,0 +1,54 @@
+"""Overdue repository for the background scheduler's due date queries."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from todo_list.models import Todo, TodoStatus
+
+
+class OverdueRepository:
+    """Repository for the due date lookups made by the overdue scheduler."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_upcoming(self, after: datetime, limit: int) -> list[tuple[datetime, UUID]]:
+        """Get the earliest open due dates strictly after a point in time."""
+        stmt = (
+            select(Todo.due_date, Todo.id)
+            .where(
+                Todo.due_date > after,
+                Todo.status != TodoStatus.completed
+            )
+            .order_by(Todo.due_date.asc())
+            .limit(limit)
+        )
+        return [tuple(row) for row in self.session.execute(stmt).all()]
+
+    def get_changed_since(self, since: datetime, after: datetime) -> list[tuple[datetime, UUID]]:
+        """Get open due dates after `after` on todos updated since `since`."""
+        stmt = (
+            select(Todo.due_date, Todo.id)
+            .where(
+                Todo.updated_at > since,
+                Todo.due_date > after,
+                Todo.status != TodoStatus.completed
+            )
+        )
+        return [tuple(row) for row in self.session.execute(stmt).all()]
+
+    def get_became_overdue(self, after: datetime, until: datetime) -> list[Todo]:
+        """Get open todos whose due date falls in the window (after, until]."""
+        stmt = (
+            select(Todo)
+            .where(
+                Todo.due_date > after,
+                Todo.due_date <= until,
+                Todo.status != TodoStatus.completed
+            )
+            .order_by(Todo.due_date.asc())
+        )
+        return list(self.session.execute(stmt).scalars().all())
@@ -3,35 +3,63 @@
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select, or_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, select, or_, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, defer, selectinload, with_expression
 
-from todo_list.models import Todo, TodoStatus
+from todo_list.models import Tag, Todo, TodoStatus, todo_tags
 from todo_list.schemas import TodoCreate, TodoListFilter
 
 
 class TodoRepository:
-    """Repository for Todo model database operations."""
+    """
+    Repository for Todo model database operations.
     
-    def __init__(self, session: Session):
+    Every query is scoped to a single owner; todos belonging to other
+    owners are never read or written through an instance.
+    """
+    
+    def __init__(self, session: Session, owner_id: UUID):
         self.session = session
+        self.owner_id = owner_id
+    
+    def _select(self) -> Select[tuple[Todo]]:
+        """Select statement for todos of the current owner."""
+        return select(Todo).where(Todo.owner_id == self.owner_id)
+    
     # ─────────────────────────────────────────────────────────────────
     # Basic CRUD
     # ─────────────────────────────────────────────────────────────────
     
     def create(self, todo_data: TodoCreate) -> Todo:
         """Create a new todo from schema data."""
-        todo = Todo(**todo_data.model_dump(exclude_unset=True))
+        data = todo_data.model_dump(exclude_unset=True)
+        tag_names = data.pop("tags", [])
+        
+        todo = Todo(**data, owner_id=self.owner_id)
+        todo.tags = self.get_or_create_tags(tag_names)
         self.session.add(todo)
         return todo
     
     def get_by_id(self, todo_id: UUID) -> Todo | None:
         """Get a todo by its ID."""
-        return self.session.get(Todo, todo_id)
+        stmt = (
+            self._select()
+            .where(Todo.id == todo_id)
+            .options(selectinload(Todo.tags))
+        )
+        return self.session.execute(stmt).scalar_one_or_none()
     
     def update(self, todo: Todo, updates: dict[str, Any]) -> Todo:
         """Update a todo with provided fields."""
         for field, value in updates.items():
+            if field == "owner_id":
+                continue
+            if field == "tags":
+                # None leaves tags unchanged; [] clears them
+                if value is None:
+                    continue
+                value = self.get_or_create_tags(value)
             if hasattr(todo, field):
                 setattr(todo, field, value)
         return todo
@@ -40,14 +68,73 @@ class TodoRepository:
         """Delete a todo."""
         self.session.delete(todo)
     
+    def get_or_create_tags(self, names: list[str]) -> list[Tag]:
+        """Get the owner's tags by name, creating any that don't exist."""
+        if not names:
+            return []
+        
+        # Called while a todo is being modified; an autoflush here would
+        # split one change into several flushes (and change log rows)
+        with self.session.no_autoflush:
+            insert_stmt = (
+                insert(Tag)
+                .values([{"owner_id": self.owner_id, "name": name} for name in names])
+                .on_conflict_do_nothing(index_elements=["owner_id", "name"])
+            )
+            self.session.execute(insert_stmt)
+        
+            # Same order as the Todo.tags relationship uses when loading
+            stmt = (
+                select(Tag)
+                .where(Tag.owner_id == self.owner_id, Tag.name.in_(names))
+                .order_by(Tag.name)
+            )
+            return list(self.session.execute(stmt).scalars().all())
+    
     # ─────────────────────────────────────────────────────────────────
     # Query Methods
     # ─────────────────────────────────────────────────────────────────
     
     def list(self, filters: TodoListFilter) -> tuple[list[Todo], int]:
         """List todos with filtering, sorting, and pagination."""
-        stmt = select(Todo)
+        stmt = self._apply_filters(self._select(), filters)
         
+        # Count total before pagination
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        total = self.session.execute(count_stmt).scalar() or 0
+            
+        # Sorting
+        sort_column = getattr(Todo, filters.sort_by.value)
+        if filters.sort_order.value == "desc":
+            sort_column = sort_column.desc()
+        stmt = stmt.order_by(sort_column)
+        
+        # Pagination
+        stmt = stmt.offset(filters.offset).limit(filters.limit)
+        
+        # Load tags for the whole page in one extra query
+        stmt = stmt.options(selectinload(Todo.tags))
+        
+        # Trim body in the database so full text is never fetched
+        if filters.body_preview is not None:
+            stmt = stmt.options(
+                defer(Todo.body),
+                with_expression(Todo.body_length, func.length(Todo.body))
+            )
+            if filters.body_preview > 0:
+                stmt = stmt.options(
+                    with_expression(
+                        Todo.body_preview, func.left(Todo.body, filters.body_preview)
+                    )
+                )
+        
+        # Execute
+        todos = self.session.execute(stmt).scalars().all()
+        
+        return list(todos), total
+    
+    def _apply_filters(self, stmt: Select, filters: TodoListFilter) -> Select:
+        """Apply the where clauses of a list filter to a todo select."""
         # Text search
         if filters.search is not None:
             search_filter = f"%{filters.search}%"
@@ -78,27 +165,50 @@ class TodoRepository:
         if filters.due_before is not None:
             stmt = stmt.where(Todo.due_date <= filters.due_before)
         
-        # Count total before pagination
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = self.session.execute(count_stmt).scalar() or 0
-            
-        # Sorting
-        sort_column = getattr(Todo, filters.sort_by.value)
-        if filters.sort_order.value == "desc":
-            sort_column = sort_column.desc()
-        stmt = stmt.order_by(sort_column)
-        
-        # Pagination
-        stmt = stmt.offset(filters.offset).limit(filters.limit)
+        # Tags
+        if filters.tags_any:
+            stmt = stmt.where(Todo.id.in_(self._tagged(filters.tags_any)))
         
-        # Execute
-        todos = self.session.execute(stmt).scalars().all()
+        if filters.tags_all:
+            tagged_all = (
+                self._tagged(filters.tags_all)
+                .group_by(todo_tags.c.todo_id)
+                .having(func.count() == len(filters.tags_all))
+            )
+            stmt = stmt.where(Todo.id.in_(tagged_all))
         
-        return list(todos), total
+        return stmt
+    
+    def _tagged(self, names: list[str]) -> Select:
+        """Select ids of todos carrying any of the named tags."""
+        return (
+            select(todo_tags.c.todo_id)
+            .join(Tag, Tag.id == todo_tags.c.tag_id)
+            .where(Tag.owner_id == self.owner_id, Tag.name.in_(names))
+        )
+    
+    def tag_counts(self, filters: TodoListFilter) -> list[tuple[str, int]]:
+        """Count todos per tag across all todos matching the filter."""
+        matching = self._apply_filters(
+            select(Todo.id).where(Todo.owner_id == self.owner_id), filters
+        )
+        count = func.count().label("count")
+        stmt = (
+            select(Tag.name, count)
+            .join(todo_tags, todo_tags.c.tag_id == Tag.id)
+            .where(todo_tags.c.todo_id.in_(matching))
+            .group_by(Tag.name)
+            .order_by(count.desc(), Tag.name)
+        )
+        return [tuple(row) for row in self.session.execute(stmt).all()]
     
     def get_by_status(self, status: TodoStatus) -> list[Todo]:
         """Get all todos with a specific status."""
-        stmt = select(Todo).where(Todo.status == status)
+        stmt = (
+            self._select()
+            .where(Todo.status == status)
+            .options(selectinload(Todo.tags))
+        )
         return list(self.session.execute(stmt).scalars().all())
     
     def get_overdue(self) -> list[Todo]:
@@ -107,11 +217,12 @@ class TodoRepository:
         
         now = datetime.now(timezone.utc)
         stmt = (
-            select(Todo)
+            self._select()
             .where(
                 Todo.due_date < now,
                 Todo.status != TodoStatus.completed
             )
             .order_by(Todo.due_date.asc())
+            .options(selectinload(Todo.tags))
         )
         return list(self.session.execute(stmt).scalars().all())
\ No newline at end of file
@@ -1,19 +1,35 @@
 from .todo import (
     SortBy,
     SortOrder,
+    TagCount,
+    TodoChangeResponse,
     TodoCreate,
+    TodoHistoryFilter,
+    TodoHistoryResponse,
     TodoListFilter,
     TodoListResponse,
+    TodoOverdueEvent,
     TodoResponse,
+    TodoSummaryListResponse,
+    TodoSummaryResponse,
     TodoUpdate,
+    build_list_response,
 )
 
 __all__ = [
     "SortBy",
     "SortOrder",
+    "TagCount",
+    "TodoChangeResponse",
     "TodoCreate",
+    "TodoHistoryFilter",
+    "TodoHistoryResponse",
     "TodoListFilter",
     "TodoListResponse",
+    "TodoOverdueEvent",
     "TodoResponse",
+    "TodoSummaryListResponse",
+    "TodoSummaryResponse",
     "TodoUpdate",
+    "build_list_response",
 ]
\ No newline at end of file
@@ -1,10 +1,11 @@
 from datetime import datetime
 from enum import Enum
+from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 
-from todo_list.models import TodoStatus, TodoPriority
+from todo_list.models import TodoChangeKind, TodoStatus, TodoPriority
 
 class Schema(BaseModel):
     model_config = ConfigDict(
@@ -12,6 +13,17 @@ class Schema(BaseModel):
         from_attributes=True,
         str_strip_whitespace=True)
 
+def normalize_tags(v: list[str] | None) -> list[str] | None:
+    """Lowercase, strip and de-duplicate tag names, keeping their order."""
+    if v is None:
+        return v
+    
+    tags = list(dict.fromkeys(tag.strip().lower() for tag in v))
+    for tag in tags:
+        if not 1 <= len(tag) <= 32:
+            raise ValueError('tags must be between 1 and 32 characters')
+    return tags
+
 class TodoCreate(Schema):
     """Schema for creating a todo"""
     
@@ -19,6 +31,7 @@ class TodoCreate(Schema):
     body: str | None = Field(default=None, description="details of todo")
     priority: TodoPriority = Field(default=TodoPriority.low, description="todo priority")
     due_date: datetime | None = Field(default=None, description="due date of todo")
+    tags: list[str] = Field(default_factory=list, description="tag names of todo")
     
     @field_validator('due_date')
     @classmethod
@@ -27,6 +40,11 @@ class TodoCreate(Schema):
             raise ValueError('due_date must be timezone-aware')
         return v
     
+    @field_validator('tags')
+    @classmethod
+    def validate_tags(cls, v: list[str]) -> list[str]:
+        return normalize_tags(v)
+    
     
 class TodoUpdate(Schema):
     """Schema for updating a todo"""
@@ -36,19 +54,56 @@ class TodoUpdate(Schema):
     status: TodoStatus | None = Field(default=None)
     priority: TodoPriority | None = Field(default=None)
     due_date: datetime | None = Field(default=None)
+    tags: list[str] | None = Field(default=None)
     
-class TodoResponse(Schema):
-    """Schema for todo responses"""
+    @field_validator('tags')
+    @classmethod
+    def validate_tags(cls, v: list[str] | None) -> list[str] | None:
+        return normalize_tags(v)
+    
+class _TodoBase(Schema):
+    """Fields shared by the full and summary todo responses"""
     
     id: UUID
     title: str
-    body: str | None
     status: TodoStatus
     priority: TodoPriority
     created_at: datetime
     updated_at: datetime
     due_date: datetime | None
+    tags: list[str] = Field(default_factory=list)
+    
+    @field_validator('tags', mode='before')
+    @classmethod
+    def tag_names(cls, v: list) -> list[str]:
+        return [tag if isinstance(tag, str) else tag.name for tag in v]
+    
+class TodoResponse(_TodoBase):
+    """Schema for todo responses"""
+    
+    body: str | None
+    
+class TodoSummaryResponse(_TodoBase):
+    """Schema for todos in list views, with the body trimmed to a preview"""
+    
+    body_preview: str | None
+    body_length: int | None
+    
+class TagCount(Schema):
+    """Schema for the number of matching todos carrying a tag"""
     
+    name: str
+    count: int
+    
+class TodoOverdueEvent(Schema):
+    """Schema for a todo that has just become overdue"""
+
+    todo_id: UUID
+    owner_id: UUID
+    title: str
+    due_date: datetime
+    detected_at: datetime
+
 class TodoListResponse(Schema):
     """Schema for paginated todos"""
     
@@ -57,6 +112,14 @@ class TodoListResponse(Schema):
     page: int
     page_size: int
     
+class TodoSummaryListResponse(Schema):
+    """Schema for paginated todos with bodies trimmed to a preview"""
+    
+    todos: list[TodoSummaryResponse]
+    total: int
+    page: int
+    page_size: int
+    
 class SortBy(str, Enum):
     """Enum for sortable fields"""
     created_at = "created_at"
@@ -80,6 +143,11 @@ class TodoListFilter(Schema):
     created_before: datetime | None = None
     due_after: datetime | None = None
     due_before: datetime | None = None
+    tags_any: list[str] | None = Field(default=None, description="match todos with any of these tags")
+    tags_all: list[str] | None = Field(default=None, description="match todos with all of these tags")
+    body_preview: int | None = Field(
+        default=None, ge=0, le=1000,
+        description="return only this many characters of body; 0 omits it, unset returns it in full")
     sort_by: SortBy = Field(default=SortBy.created_at)
     sort_order: SortOrder = Field(default=SortOrder.desc)
     limit: int = Field(default=10, ge=1, le=100)
@@ -91,5 +159,48 @@ class TodoListFilter(Schema):
         if v is not None and v.tzinfo is None:
             raise ValueError('datetime fields must be timezone-aware')
         return v
+    
+    @field_validator('tags_any', 'tags_all')
+    @classmethod
+    def validate_tags(cls, v: list[str] | None) -> list[str] | None:
+        return normalize_tags(v)
 
-    
\ No newline at end of file
+def build_list_response(
+    todos: list, total: int, filters: TodoListFilter
+) -> TodoListResponse | TodoSummaryListResponse:
+    """
+    Build the list response matching how the todos were loaded.
+    
+    The model is chosen from `filters.body_preview` rather than left to
+    union validation: full todos have no preview, and summary todos
+    have a deferred body that would be loaded row by row.
+    """
+    response_class = (
+        TodoListResponse if filters.body_preview is None else TodoSummaryListResponse
+    )
+    return response_class(
+        todos=todos,
+        total=total,
+        page=filters.offset // filters.limit + 1,
+        page_size=filters.limit,
+    )
+
+class TodoChangeResponse(Schema):
+    """Schema for one entry of a todo's change history"""
+    
+    id: int
+    kind: TodoChangeKind
+    changed_at: datetime
+    changes: dict[str, Any]
+
+class TodoHistoryFilter(Schema):
+    """Schema for paging through a todo's change history"""
+    
+    limit: int = Field(default=20, ge=1, le=100)
+    before: int | None = Field(default=None, ge=1, description="only changes older than this change id")
+
+class TodoHistoryResponse(Schema):
+    """Schema for a page of todo history, newest first"""
+    
+    changes: list[TodoChangeResponse]
+    next_before: int | None = Field(default=None, description="cursor for the next page, if any")
@@ -1,11 +1,16 @@
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 from sqlalchemy.orm import Session
 
 from todo_list.models import Todo, TodoPriority, TodoStatus
 from todo_list.models.todo import utcnow
-from todo_list.schemas import TodoCreate, TodoUpdate, TodoListFilter
+from todo_list.schemas import (
+    TagCount, TodoCreate, TodoUpdate, TodoListFilter, TodoHistoryFilter, TodoHistoryResponse
+)
 from todo_list.repositories.todo import TodoRepository
+from todo_list.repositories.history import TodoHistoryRepository
+from todo_list.extensions import overdue_scheduler
 
 
 # Custom Exceptions
@@ -26,10 +31,12 @@ class InvalidStatusTransitionError(TodoValidationError):
 
 class TodoService:
     """
-    Orchestrates todo CRUD operations used by API layer
+    Orchestrates todo CRUD operations used by API layer,
+    scoped to the todos of a single owner
     """
-    def __init__(self, session: Session):
-        self.repository = TodoRepository(session)
+    def __init__(self, session: Session, owner_id: UUID):
+        self.repository = TodoRepository(session, owner_id)
+        self.history = TodoHistoryRepository(session, owner_id)
     
     def get_todo(self, id: UUID) -> Todo | None:
         return self.repository.get_by_id(id)
@@ -40,6 +47,7 @@ class TodoService:
         
         todo = self.repository.create(todo_create)
         self.repository.session.flush()  # Ensure ID is generated
+        overdue_scheduler.notify(todo)
         return todo
     
     def update_todo(self, todo_id: UUID, todo_update: TodoUpdate) -> Todo | None:
@@ -62,6 +70,9 @@ class TodoService:
         
         updated_todo = self.repository.update(todo, updates)
         self.repository.session.flush()  # Ensure changes are flushed
+        
+        if 'due_date' in updates or 'status' in updates:
+            overdue_scheduler.notify(updated_todo)
         return updated_todo
     
     def delete_todo(self, todo_id: UUID) -> bool:
@@ -76,6 +87,13 @@ class TodoService:
     def list_todos(self, filters: TodoListFilter) -> tuple[list[Todo], int]:
         return self.repository.list(filters)
     
+    def get_tag_counts(self, filters: TodoListFilter) -> list[TagCount]:
+        """Tag facet counts for all todos matching the filter."""
+        return [
+            TagCount(name=name, count=count)
+            for name, count in self.repository.tag_counts(filters)
+        ]
+    
     def get_by_status(self, status: TodoStatus) -> list[Todo]:
         return self.repository.get_by_status(status)
     
@@ -109,6 +127,7 @@ class TodoService:
         
         updated_todo = self.repository.update(todo, updates)
         self.repository.session.flush()
+        overdue_scheduler.notify(updated_todo)
         return updated_todo
     
     def update_priority(self, todo_id: UUID, new_priority: TodoPriority) -> Todo:
@@ -126,4 +145,15 @@ class TodoService:
         updated_todo = self.repository.update(todo, updates)
         self.repository.session.flush()
         return updated_todo
-    
\ No newline at end of file
+    
+    def get_history(self, todo_id: UUID, filters: TodoHistoryFilter) -> TodoHistoryResponse:
+        """Page of a todo's changes, newest first, with the cursor for the next page."""
+        changes, next_before = self.history.list(todo_id, filters.limit, filters.before)
+        return TodoHistoryResponse(changes=changes, next_before=next_before)
+    
+    def get_status_at(self, todo_id: UUID, at: datetime) -> TodoStatus | None:
+        """Status of a todo at a point in time, or None if it did not exist then."""
+        if at.tzinfo is None:
+            raise TodoValidationError("Point in time must be timezone-aware")
+        
+        return self.history.status_at(todo_id, at)
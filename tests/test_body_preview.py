@@ -0,0 +1,71 @@
+"""Tests for trimmed todo bodies in list views."""
+
+import pytest
+from sqlalchemy import inspect
+
+from todo_list.schemas import (
+    TodoListFilter,
+    TodoListResponse,
+    TodoSummaryListResponse,
+    build_list_response,
+)
+
+BODY = "The quick brown fox jumps over the lazy dog"
+
+
+@pytest.fixture(autouse=True)
+def stored(session, create_todo):
+    create_todo(body=BODY)
+    session.expire_all()
+
+
+def test_default_list_returns_full_body(repo, count_queries):
+    filters = TodoListFilter()
+    todos, total = repo.list(filters)
+
+    with count_queries(repo.session) as statements:
+        response = build_list_response(todos, total, filters)
+
+    assert isinstance(response, TodoListResponse)
+    assert response.todos[0].body == BODY
+    assert statements == []
+
+
+def test_preview_list_trims_body_in_the_database(repo, count_queries):
+    filters = TodoListFilter(body_preview=9)
+    todos, total = repo.list(filters)
+
+    assert "body" in inspect(todos[0]).unloaded
+
+    with count_queries(repo.session) as statements:
+        response = build_list_response(todos, total, filters)
+
+    assert isinstance(response, TodoSummaryListResponse)
+    assert response.todos[0].body_preview == "The quick"
+    assert response.todos[0].body_length == len(BODY)
+    # The deferred body is never loaded
+    assert statements == []
+
+
+def test_zero_preview_omits_body(repo):
+    filters = TodoListFilter(body_preview=0)
+    todos, total = repo.list(filters)
+
+    response = build_list_response(todos, total, filters)
+
+    assert response.todos[0].body_preview is None
+    assert response.todos[0].body_length == len(BODY)
+
+
+def test_get_by_id_still_returns_full_body(repo):
+    todos, _ = repo.list(TodoListFilter(body_preview=5))
+
+    assert repo.get_by_id(todos[0].id).body == BODY
+
+
+def test_list_response_reports_page(repo):
+    filters = TodoListFilter(limit=5, offset=10)
+
+    response = build_list_response([], 11, filters)
+
+    assert (response.page, response.page_size, response.total) == (3, 5, 11)
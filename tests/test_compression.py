@@ -0,0 +1,150 @@
+"""Tests for response compression."""
+
+import importlib.util
+import json
+import zlib
+
+import pytest
+from flask import Flask, Response, jsonify
+
+from todo_list.api.compression import ENCODERS, compress_response
+from todo_list.config import settings
+
+LARGE = {"todos": [{"title": "todo", "body": "lorem ipsum " * 50}] * 20}
+
+
+def decoder(encoding: str):
+    """Streaming decompress function for an encoding, skipping if its package is missing."""
+    if encoding == "gzip":
+        return zlib.decompressobj(zlib.MAX_WBITS | 16).decompress
+    if encoding == "br":
+        return pytest.importorskip("brotli").Decompressor().process
+    return pytest.importorskip("zstandard").ZstdDecompressor().decompressobj().decompress
+
+
+ENCODINGS = ["gzip", "br", "zstd"]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "compression_min_size", 1024)
+
+    app = Flask(__name__)
+    app.after_request(compress_response)
+
+    @app.route("/large")
+    def large():
+        return jsonify(LARGE)
+
+    @app.route("/small")
+    def small():
+        return jsonify({"status": "ok"})
+
+    @app.route("/png")
+    def png():
+        return Response(b"\x89PNG" * 1000, mimetype="image/png")
+
+    @app.route("/encoded")
+    def encoded():
+        response = jsonify(LARGE)
+        response.headers["Content-Encoding"] = "identity"
+        return response
+
+    @app.route("/not-modified")
+    def not_modified():
+        return Response(status=304)
+
+    @app.route("/etag")
+    def etag():
+        response = jsonify(LARGE)
+        response.set_etag("abc")
+        return response
+
+    @app.route("/stream")
+    def stream():
+        chunks = (json.dumps({"n": i}).encode() + b"\n" for i in range(3))
+        return Response(chunks, mimetype="application/json")
+
+    return app.test_client()
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_compresses_large_json(client, encoding):
+    decompress = decoder(encoding)
+    response = client.get("/large", headers={"Accept-Encoding": encoding})
+
+    assert response.headers["Content-Encoding"] == encoding
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert json.loads(decompress(response.data)) == LARGE
+    assert len(response.data) < len(json.dumps(LARGE))
+
+
+def test_small_bodies_are_not_compressed(client):
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.json == {"status": "ok"}
+
+
+def test_no_accept_encoding_is_not_compressed(client):
+    response = client.get("/large")
+
+    assert "Content-Encoding" not in response.headers
+    assert response.json == LARGE
+
+
+def test_unsupported_encoding_is_not_compressed(client):
+    response = client.get("/large", headers={"Accept-Encoding": "compress"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_client_preference_wins(client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip;q=1.0, zstd;q=0.5, br;q=0.5"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+
+
+def test_zstd_preferred_when_equally_accepted(client):
+    pytest.importorskip("zstandard")
+    response = client.get("/large", headers={"Accept-Encoding": "gzip, zstd"})
+
+    assert response.headers["Content-Encoding"] == "zstd"
+
+
+@pytest.mark.parametrize("path", ["/png", "/encoded", "/not-modified"])
+def test_ineligible_responses_are_untouched(client, path):
+    response = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers.get("Content-Encoding") != "gzip"
+
+
+def test_strong_etag_becomes_weak(client):
+    response = client.get("/etag", headers={"Accept-Encoding": "gzip"})
+
+    assert response.get_etag() == ("abc", True)
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_streamed_response_is_compressed_chunk_by_chunk(client, encoding):
+    decompress = decoder(encoding)
+    response = client.get("/stream", headers={"Accept-Encoding": encoding}, buffered=False)
+
+    assert response.headers["Content-Encoding"] == encoding
+    assert "Content-Length" not in response.headers
+
+    decoded = [decompress(chunk) for chunk in response.response]
+
+    # Every source chunk is readable as soon as it arrives
+    assert decoded[:3] == [b'{"n": 0}\n', b'{"n": 1}\n', b'{"n": 2}\n']
+    response.close()
+
+
+def test_encoders_match_installed_packages():
+    expected = ["gzip"]
+    for encoding, package in (("br", "brotli"), ("zstd", "zstandard")):
+        if importlib.util.find_spec(package) is not None:
+            expected.append(encoding)
+
+    assert sorted(ENCODERS) == sorted(expected)
@@ -0,0 +1,185 @@
+"""Tests for the todo change log."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select, text
+
+from todo_list.models import TodoChange, TodoChangeKind, TodoPriority, TodoStatus
+from todo_list.models.todo import utcnow
+from todo_list.repositories.history import (
+    TodoHistoryRepository,
+    _to_json,
+    register_history_listener,
+)
+from todo_list.schemas import TodoHistoryResponse
+
+
+@pytest.fixture(autouse=True)
+def history_listener(session):
+    register_history_listener(session)
+
+
+@pytest.fixture
+def history(session, repo):
+    return TodoHistoryRepository(session, repo.owner_id)
+
+
+def changes_of(session, todo_id) -> list[TodoChange]:
+    stmt = select(TodoChange).where(TodoChange.todo_id == todo_id).order_by(TodoChange.id)
+    return list(session.execute(stmt).scalars().all())
+
+
+# ─────────────────────────────────────────────────────────────────
+# Serialization
+# ─────────────────────────────────────────────────────────────────
+
+def test_to_json_converts_enums_and_datetimes():
+    moment = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    assert _to_json("status", TodoStatus.in_progress) == "in_progress"
+    assert _to_json("due_date", moment) == "2026-01-02T03:04:05+00:00"
+    assert _to_json("title", "todo") == "todo"
+
+
+# ─────────────────────────────────────────────────────────────────
+# Capture
+# ─────────────────────────────────────────────────────────────────
+
+def test_create_records_snapshot(session, repo, create_todo):
+    todo = create_todo(body="details", tags=["work"])
+
+    [change] = changes_of(session, todo.id)
+
+    assert change.kind == TodoChangeKind.created
+    assert change.owner_id == repo.owner_id
+    assert change.changes == {
+        "title": "todo",
+        "body": "details",
+        "status": TodoStatus.not_started.value,
+        "priority": TodoPriority.low.value,
+        "due_date": None,
+        "tags": ["work"],
+    }
+
+
+def test_update_records_one_compact_diff(session, repo, create_todo):
+    todo = create_todo(body="details")
+
+    repo.update(todo, {"title": "renamed", "tags": ["work", "home"]})
+    session.flush()
+
+    change = changes_of(session, todo.id)[-1]
+    assert len(changes_of(session, todo.id)) == 2
+    assert change.kind == TodoChangeKind.updated
+    assert change.changes == {"title": "renamed", "tags": ["home", "work"]}
+
+
+def test_update_records_cleared_tags_and_due_date(session, repo, create_todo):
+    todo = create_todo(tags=["work"], due_date=utcnow())
+
+    repo.update(todo, {"tags": [], "due_date": None})
+    session.flush()
+
+    change = changes_of(session, todo.id)[-1]
+    assert change.changes == {"tags": [], "due_date": None}
+
+
+def test_update_without_tracked_changes_records_nothing(session, repo, create_todo):
+    todo = create_todo()
+
+    repo.update(todo, {"updated_at": utcnow()})
+    session.flush()
+
+    assert len(changes_of(session, todo.id)) == 1
+
+
+def test_delete_records_end_of_status(session, repo, create_todo):
+    todo = create_todo()
+
+    repo.delete(todo)
+    session.flush()
+
+    change = changes_of(session, todo.id)[-1]
+    assert change.kind == TodoChangeKind.deleted
+    assert change.changes == {"status": None}
+
+
+# ─────────────────────────────────────────────────────────────────
+# Queries
+# ─────────────────────────────────────────────────────────────────
+
+def test_list_pages_newest_first_to_the_end(session, repo, history, create_todo):
+    todo = create_todo()
+    for i in range(4):
+        repo.update(todo, {"title": f"title {i}"})
+        session.flush()
+
+    first, cursor = history.list(todo.id, limit=2)
+    second, cursor = history.list(todo.id, limit=2, before=cursor)
+    last, cursor = history.list(todo.id, limit=2, before=cursor)
+
+    assert [c.changes["title"] for c in first] == ["title 3", "title 2"]
+    assert [c.changes["title"] for c in second] == ["title 1", "title 0"]
+    assert [c.kind for c in last] == [TodoChangeKind.created]
+    assert cursor is None
+
+
+def test_list_has_no_cursor_when_page_is_exactly_full(history, create_todo):
+    todo = create_todo()
+
+    changes, cursor = history.list(todo.id, limit=1)
+
+    assert len(changes) == 1
+    assert cursor is None
+
+
+def test_history_response_serializes_changes(history, create_todo):
+    todo = create_todo(tags=["work"])
+    changes, cursor = history.list(todo.id, limit=10)
+
+    response = TodoHistoryResponse(changes=changes, next_before=cursor)
+
+    [change] = response.model_dump(mode="json")["changes"]
+    assert change["kind"] == "created"
+    assert change["changes"]["tags"] == ["work"]
+    assert response.next_before is None
+
+
+def test_list_hides_other_owners_history(session, create_todo):
+    todo = create_todo()
+    other = TodoHistoryRepository(session, uuid.uuid4())
+
+    assert other.list(todo.id, limit=10) == ([], None)
+
+
+def test_status_at_follows_transitions(session, repo, history, create_todo):
+    before_create = utcnow()
+    todo = create_todo()
+    after_create = utcnow()
+
+    repo.update(todo, {"title": "renamed"})
+    session.flush()
+    repo.update(todo, {"status": TodoStatus.in_progress})
+    session.flush()
+    after_start = utcnow()
+
+    repo.delete(todo)
+    session.flush()
+    after_delete = utcnow()
+
+    assert history.status_at(todo.id, before_create) is None
+    assert history.status_at(todo.id, after_create) == TodoStatus.not_started
+    assert history.status_at(todo.id, after_start) == TodoStatus.in_progress
+    assert history.status_at(todo.id, after_delete) is None
+
+
+def test_status_at_reads_the_partial_index(session, history, create_todo):
+    todo = create_todo()
+    session.execute(text("SET LOCAL enable_seqscan = off"))
+
+    compiled = history._status_at_select(todo.id, utcnow()).compile(bind=session.connection())
+    plan = session.connection().exec_driver_sql(f"EXPLAIN {compiled}", compiled.params).scalars().all()
+
+    assert "ix_todo_changes_todo_status" in "\n".join(plan)
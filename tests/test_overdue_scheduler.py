@@ -0,0 +1,259 @@
+"""Tests for the overdue scheduler."""
+
+import socket
+import threading
+import time
+import uuid
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from todo_list.config import settings
+from todo_list.jobs import OverdueScheduler
+from todo_list.models import Todo, TodoStatus
+from todo_list.models.todo import utcnow
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = OverdueScheduler()
+    scheduler._watermark = utcnow()
+    scheduler._last_refresh = scheduler._watermark
+    return scheduler
+
+
+# ─────────────────────────────────────────────────────────────────
+# Heap
+# ─────────────────────────────────────────────────────────────────
+
+def test_push_reports_new_minimum(scheduler):
+    now = scheduler._watermark
+
+    assert scheduler._push(now + timedelta(minutes=10), uuid.uuid4())
+    assert not scheduler._push(now + timedelta(minutes=20), uuid.uuid4())
+    assert scheduler._push(now + timedelta(minutes=5), uuid.uuid4())
+    assert len(scheduler._heap) == 3
+
+
+def test_push_skips_due_dates_at_or_before_watermark(scheduler):
+    assert not scheduler._push(scheduler._watermark, uuid.uuid4())
+    assert scheduler._heap == []
+
+
+def test_push_skips_due_dates_past_horizon(scheduler):
+    scheduler._horizon = scheduler._watermark + timedelta(hours=1)
+
+    assert not scheduler._push(scheduler._horizon + timedelta(seconds=1), uuid.uuid4())
+    assert scheduler._heap == []
+
+
+# ─────────────────────────────────────────────────────────────────
+# Timing
+# ─────────────────────────────────────────────────────────────────
+
+def test_next_timeout_waits_for_refresh_when_heap_empty(scheduler, monkeypatch):
+    monkeypatch.setattr(settings, "overdue_refresh_interval", 30.0)
+
+    assert scheduler._next_timeout(scheduler._last_refresh) == 30.0
+
+
+def test_next_timeout_waits_for_next_due_date(scheduler, monkeypatch):
+    monkeypatch.setattr(settings, "overdue_refresh_interval", 30.0)
+    monkeypatch.setattr(settings, "overdue_batch_window", 1.0)
+    now = scheduler._last_refresh
+    scheduler._push(now + timedelta(seconds=5), uuid.uuid4())
+
+    assert scheduler._next_timeout(now) == 6.0
+
+
+def test_next_timeout_is_never_negative(scheduler):
+    later = scheduler._last_refresh + timedelta(hours=1)
+
+    assert scheduler._next_timeout(later) == 0.0
+
+
+# ─────────────────────────────────────────────────────────────────
+# Scanning
+# ─────────────────────────────────────────────────────────────────
+
+def make_todo(**fields) -> Todo:
+    return Todo(owner_id=uuid.uuid4(), title="todo", **fields)
+
+
+def test_run_pending_emits_each_todo_once(session, scheduler):
+    scheduler.db = SimpleNamespace(session=session)
+    now = scheduler._watermark
+    todo = make_todo(due_date=now + timedelta(seconds=1))
+    session.add(todo)
+    session.flush()
+
+    received = []
+    scheduler.subscribe(received.append)
+
+    events = scheduler.run_pending(now + timedelta(seconds=2))
+
+    assert [event.todo_id for event in events] == [todo.id]
+    assert received == [events]
+    assert scheduler.run_pending(now + timedelta(seconds=3)) == []
+
+
+def test_run_pending_skips_completed_todos(session, scheduler):
+    scheduler.db = SimpleNamespace(session=session)
+    now = scheduler._watermark
+    session.add(make_todo(due_date=now + timedelta(seconds=1), status=TodoStatus.completed))
+    session.flush()
+
+    assert scheduler.run_pending(now + timedelta(seconds=2)) == []
+
+
+def test_run_pending_catches_late_commits(engine, scheduler, monkeypatch):
+    monkeypatch.setattr(settings, "overdue_commit_grace", 5.0)
+    now = scheduler._watermark
+    writer = Session(engine)
+    reader = Session(engine)
+    scheduler.db = SimpleNamespace(session=reader)
+
+    todo = make_todo(due_date=now + timedelta(seconds=1))
+    try:
+        writer.add(todo)
+        writer.flush()
+
+        # Due date passes while the writing transaction is still open
+        assert scheduler.run_pending(now + timedelta(seconds=2)) == []
+        reader.rollback()
+
+        writer.commit()
+
+        events = scheduler.run_pending(now + timedelta(seconds=3))
+        assert [event.todo_id for event in events] == [todo.id]
+    finally:
+        reader.close()
+        writer.execute(delete(Todo).where(Todo.id == todo.id))
+        writer.commit()
+        writer.close()
+
+
+# ─────────────────────────────────────────────────────────────────
+# Notifications
+# ─────────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def listener(engine, scheduler):
+    """Lock connection of a leader listening for due date changes."""
+    channel = settings.overdue_notify_channel
+    with engine.connect() as conn:
+        OverdueScheduler._listen(conn, channel)
+        scheduler._waker = socket.socketpair()
+        yield conn
+        for sock in scheduler._waker:
+            sock.close()
+        OverdueScheduler._unlisten(conn, channel)
+
+
+def receive(scheduler, conn) -> None:
+    time.sleep(0.1)
+    scheduler._receive(conn.connection.driver_connection)
+
+
+def test_notify_is_delivered_across_connections_on_commit(engine, scheduler, listener):
+    todo = make_todo(id=uuid.uuid4(), due_date=scheduler._watermark + timedelta(minutes=5))
+
+    with Session(engine) as writer:
+        scheduler.notify(writer.merge(todo))
+        receive(scheduler, listener)
+        assert scheduler._heap == []
+
+        writer.commit()
+
+    receive(scheduler, listener)
+    assert scheduler._heap == [(todo.due_date, todo.id)]
+
+
+def test_notify_is_dropped_on_rollback(engine, scheduler, listener):
+    todo = make_todo(id=uuid.uuid4(), due_date=scheduler._watermark + timedelta(minutes=5))
+
+    with Session(engine) as writer:
+        scheduler.notify(writer.merge(todo))
+        writer.rollback()
+
+    receive(scheduler, listener)
+    assert scheduler._heap == []
+
+
+def test_notify_ignores_completed_todos(engine, scheduler, listener):
+    todo = make_todo(
+        id=uuid.uuid4(),
+        due_date=scheduler._watermark + timedelta(minutes=5),
+        status=TodoStatus.completed,
+    )
+
+    with Session(engine) as writer:
+        scheduler.notify(writer.merge(todo))
+        writer.commit()
+
+    receive(scheduler, listener)
+    assert scheduler._heap == []
+
+
+def test_wait_shortens_sleep_for_earlier_due_date(engine, scheduler, listener, monkeypatch):
+    monkeypatch.setattr(settings, "overdue_batch_window", 0.0)
+    scheduler._last_refresh = utcnow()
+    todo = make_todo(id=uuid.uuid4(), due_date=utcnow() + timedelta(seconds=1))
+
+    with Session(engine) as writer:
+        scheduler.notify(writer.merge(todo))
+        writer.commit()
+
+    start = time.monotonic()
+    scheduler._wait(listener)
+
+    assert scheduler._heap == [(todo.due_date, todo.id)]
+    assert time.monotonic() - start < 2
+
+
+def test_stop_interrupts_wait(scheduler, listener):
+    scheduler._last_refresh = utcnow()
+    threading.Timer(0.1, scheduler.stop).start()
+
+    start = time.monotonic()
+    scheduler._wait(listener)
+
+    assert time.monotonic() - start < 2
+
+
+# ─────────────────────────────────────────────────────────────────
+# Leadership
+# ─────────────────────────────────────────────────────────────────
+
+def test_holds_lock_tracks_the_advisory_lock(engine):
+    key = settings.overdue_advisory_lock_key
+
+    with engine.connect() as leader, engine.connect() as follower:
+        assert OverdueScheduler._try_lock(leader, key)
+        assert not OverdueScheduler._try_lock(follower, key)
+
+        assert OverdueScheduler._holds_lock(leader, key)
+        assert not OverdueScheduler._holds_lock(follower, key)
+
+        OverdueScheduler._unlock(leader, key)
+        assert not OverdueScheduler._holds_lock(leader, key)
+
+
+def test_holds_lock_is_false_once_connection_is_gone(engine):
+    key = settings.overdue_advisory_lock_key
+
+    with engine.connect() as leader, engine.connect() as admin:
+        assert OverdueScheduler._try_lock(leader, key)
+        pid = leader.execute(select(func.pg_backend_pid())).scalar()
+        leader.commit()
+
+        admin.execute(select(func.pg_terminate_backend(pid)))
+        admin.commit()
+
+        assert not OverdueScheduler._holds_lock(leader, key)
+        # The lock is free for another worker to take over
+        assert OverdueScheduler._try_lock(admin, key)
+        OverdueScheduler._unlock(admin, key)
@@ -0,0 +1,133 @@
+"""Tests for todo tags."""
+
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from todo_list.repositories.todo import TodoRepository
+from todo_list.schemas import TodoCreate, TodoListFilter, TodoResponse
+from todo_list.schemas.todo import normalize_tags
+
+
+def titles(todos) -> set[str]:
+    return {todo.title for todo in todos}
+
+
+# ─────────────────────────────────────────────────────────────────
+# Validation
+# ─────────────────────────────────────────────────────────────────
+
+def test_normalize_tags_lowercases_strips_and_dedupes():
+    assert normalize_tags([" Work", "home", "WORK"]) == ["work", "home"]
+
+
+def test_normalize_tags_passes_none_through():
+    assert normalize_tags(None) is None
+
+
+@pytest.mark.parametrize("tag", ["", "   ", "x" * 33])
+def test_tags_must_be_between_1_and_32_characters(tag):
+    with pytest.raises(ValidationError):
+        TodoCreate(title="todo", tags=[tag])
+
+
+# ─────────────────────────────────────────────────────────────────
+# Storage
+# ─────────────────────────────────────────────────────────────────
+
+def test_create_reuses_existing_tags(create_todo):
+    first = create_todo("a", tags=["work"])
+    second = create_todo("b", tags=["work", "home"])
+
+    assert first.tags[0] is next(tag for tag in second.tags if tag.name == "work")
+
+
+def test_tags_are_scoped_to_owner(session, create_todo):
+    other = TodoRepository(session, uuid.uuid4())
+    mine = create_todo("a", tags=["work"])
+    theirs = create_todo("b", tags=["work"], repo=other)
+
+    assert mine.tags[0].id != theirs.tags[0].id
+
+
+def test_update_with_none_leaves_tags_unchanged(repo, create_todo):
+    todo = create_todo("a", tags=["work"])
+
+    repo.update(todo, {"tags": None})
+
+    assert [tag.name for tag in todo.tags] == ["work"]
+
+
+def test_update_with_empty_list_clears_tags(repo, create_todo):
+    todo = create_todo("a", tags=["work"])
+
+    repo.update(todo, {"tags": []})
+
+    assert todo.tags == []
+
+
+def test_response_serializes_tag_names(create_todo):
+    todo = create_todo("a", tags=["work", "home"])
+
+    assert TodoResponse.model_validate(todo).tags == ["home", "work"]
+
+
+# ─────────────────────────────────────────────────────────────────
+# Filtering
+# ─────────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def tagged(repo, create_todo):
+    create_todo("work only", tags=["work"])
+    create_todo("home only", tags=["home"])
+    create_todo("both", tags=["work", "home"])
+    create_todo("untagged", tags=[])
+    repo.session.expire_all()
+
+
+def test_tags_any_matches_todos_with_any_tag(repo, tagged):
+    todos, total = repo.list(TodoListFilter(tags_any=["work", "home"]))
+
+    assert titles(todos) == {"work only", "home only", "both"}
+    assert total == 3
+
+
+def test_tags_all_matches_todos_with_every_tag(repo, tagged):
+    todos, total = repo.list(TodoListFilter(tags_all=["work", "home"]))
+
+    assert titles(todos) == {"both"}
+    assert total == 1
+
+
+def test_tags_filter_ignores_other_owners_tags(session, repo, tagged, create_todo):
+    other = TodoRepository(session, uuid.uuid4())
+    create_todo("theirs", tags=["work"], repo=other)
+
+    todos, _ = repo.list(TodoListFilter(tags_any=["work"]))
+
+    assert titles(todos) == {"work only", "both"}
+
+
+def test_list_loads_tags_without_n_plus_one(repo, tagged, count_queries):
+    with count_queries(repo.session) as statements:
+        todos, _ = repo.list(TodoListFilter())
+        names = [[tag.name for tag in todo.tags] for todo in todos]
+
+    # count, page, and one selectin load for all tags
+    assert len(statements) == 3
+    assert sorted(map(tuple, names)) == [(), ("home",), ("home", "work"), ("work",)]
+
+
+def test_tag_counts_in_a_single_query(repo, tagged, count_queries):
+    with count_queries(repo.session) as statements:
+        counts = repo.tag_counts(TodoListFilter())
+
+    assert len(statements) == 1
+    assert counts == [("home", 2), ("work", 2)]
+
+
+def test_tag_counts_respect_filters(repo, tagged):
+    counts = repo.tag_counts(TodoListFilter(tags_all=["work"]))
+
+    assert counts == [("work", 2), ("home", 1)]
@@ -0,0 +1,105 @@
+"""Tests for the owner-scoped todo repository."""
+
+import uuid
+from datetime import timedelta
+
+import pytest
+from flask import Flask
+from werkzeug.exceptions import BadRequest
+
+from todo_list.api.dependencies import get_owned_repository, get_owner_id
+from todo_list.config import settings
+from todo_list.extensions import db
+from todo_list.models import Todo
+from todo_list.models.todo import utcnow
+from todo_list.repositories.todo import TodoRepository
+from todo_list.schemas import TodoListFilter
+
+
+@pytest.fixture
+def other_repo(session):
+    return TodoRepository(session, uuid.uuid4())
+
+
+# ─────────────────────────────────────────────────────────────────
+# Owner Isolation
+# ─────────────────────────────────────────────────────────────────
+
+def test_create_sets_owner(repo, create_todo):
+    todo = create_todo()
+
+    assert todo.owner_id == repo.owner_id
+
+
+def test_get_by_id_hides_other_owners_todos(repo, other_repo, create_todo):
+    todo = create_todo()
+
+    assert repo.get_by_id(todo.id) is todo
+    assert other_repo.get_by_id(todo.id) is None
+
+
+def test_list_only_returns_own_todos(repo, other_repo, create_todo):
+    create_todo("mine")
+    create_todo("theirs", repo=other_repo)
+
+    todos, total = repo.list(TodoListFilter())
+
+    assert [todo.title for todo in todos] == ["mine"]
+    assert total == 1
+
+
+def test_update_cannot_change_owner(repo, create_todo):
+    todo = create_todo()
+
+    repo.update(todo, {"owner_id": uuid.uuid4(), "title": "renamed"})
+
+    assert todo.owner_id == repo.owner_id
+    assert todo.title == "renamed"
+
+
+def test_get_overdue_only_returns_own_todos(session, repo, other_repo):
+    past = utcnow() - timedelta(hours=1)
+    session.add_all([
+        Todo(owner_id=repo.owner_id, title="mine", due_date=past),
+        Todo(owner_id=other_repo.owner_id, title="theirs", due_date=past),
+    ])
+    session.flush()
+
+    assert [todo.title for todo in repo.get_overdue()] == ["mine"]
+
+
+# ─────────────────────────────────────────────────────────────────
+# Owner Header
+# ─────────────────────────────────────────────────────────────────
+
+def test_get_owner_id_reads_header():
+    owner_id = uuid.uuid4()
+    app = Flask(__name__)
+
+    with app.test_request_context(headers={settings.owner_header: str(owner_id)}):
+        assert get_owner_id() == owner_id
+
+
+@pytest.mark.parametrize("headers", [{}, {settings.owner_header: "not-a-uuid"}])
+def test_get_owner_id_rejects_missing_or_invalid_header(headers):
+    app = Flask(__name__)
+
+    with app.test_request_context(headers=headers):
+        with pytest.raises(BadRequest):
+            get_owner_id()
+
+
+def test_get_owned_repository_is_scoped_to_header_owner_and_cached():
+    owner_id = uuid.uuid4()
+    app = Flask(__name__)
+    headers = {settings.owner_header: str(owner_id)}
+
+    with app.test_request_context(headers=headers):
+        repo = get_owned_repository(TodoRepository)
+
+        assert repo.owner_id == owner_id
+        assert repo.session is db.session
+        assert get_owned_repository(TodoRepository) is repo
+
+    with app.test_request_context(headers=headers):
+        assert get_owned_repository(TodoRepository) is not repo